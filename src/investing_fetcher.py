@@ -1,15 +1,77 @@
+import asyncio
+import httpx
+import numpy as np
 import pandas as pd
 import streamlit as st
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+from uuid import uuid4
+import logging
+import os
+import random
+import threading
 import time
 import traceback
 
+from .utils.cache import FileCache
+
+
+log = logging.getLogger(__name__)
+
+# Set INVESTING_DEBUG=1 to show full tracebacks in the app
+_DEBUG = bool(os.environ.get('INVESTING_DEBUG'))
+
+VNMIDCAP_INVESTING_ID = '995069'
+_NS_PER_DAY = 86400 * 1_000_000_000
+L1_CACHE_TTL = 1800  # st.cache_data TTL - 30 minutes (data updates once per day)
+
+# Summaries of L1 entries, rebuilt whenever the L1 body runs and expiring with it
+_summaries_lock = threading.Lock()
+_summaries = {}  # period_days -> (expires_at, summary dict)
+
+# Stale-while-revalidate: serve the cached copy up to SWR_MAX_AGE old,
+# refreshing it in the background once it is older than SWR_REFRESH_AFTER
+SWR_MAX_AGE = 7 * 86400
+SWR_REFRESH_AFTER = 6 * 3600
+_refresh_lock = threading.Lock()
+_refreshing = set()  # (investing_id, period_days) with a background refresh in flight
+
+# Circuit breaker: after CIRCUIT_FAILURE_THRESHOLD consecutive fetches exhaust
+# their retries because Investing.com itself is unreachable (transport error,
+# 5xx, 429), skip the network for CIRCUIT_OPEN_SECONDS. Bad payloads for one
+# symbol don't count - they say nothing about the source being down.
+# The threshold of 2 is our own choice, not from Investing.com:
+# each fetch already makes max_retries (3) attempts, so 2 means ~6 failed
+# requests in a row. That rides out a single flaky fetch but trips before
+# every session starts hammering a blocked IP.
+CIRCUIT_FAILURE_THRESHOLD = 2
+CIRCUIT_OPEN_SECONDS = 60
+_circuit_lock = threading.Lock()
+_circuit = {'failures': 0, 'open_until': 0.0}
+
+# Investing.com TradingView history endpoint (the one the investiny library wraps)
+_INVESTING_HISTORY_URL = 'https://tvc4.investing.com/{uuid}/0/0/0/0/history'
+_INVESTING_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                  '(KHTML, like Gecko) Chrome/99.0.4844.84 Safari/537.36',
+    'Referer': 'https://tvc-invdn-com.investing.com/',
+    'Content-Type': 'application/json',
+}
+
+
+class _FetchFailed(Exception):
+    """Raised inside the st.cache_data layer so failed fetches are never cached"""
+
 
-@st.cache_data(ttl=1800)  # Cache for 30 minutes (data updates once per day)
 def fetch_vnmidcap_from_investing(period_days: int = 365, max_retries: int = 3) -> Optional[pd.DataFrame]:
     """
-    Fetch VNMIDCAP data from Investing.com via investiny library with retry mechanism
+    Fetch VNMIDCAP data from Investing.com's history endpoint with retry mechanism
+
+    `st.cache_data` is the in-process L1 cache (successes only); a persistent
+    parquet cache on disk (L2) keeps the data across container restarts.
+    The disk copy is served immediately while it is younger than SWR_MAX_AGE
+    (refreshed in the background after SWR_REFRESH_AFTER), and as a fallback
+    whenever Investing.com is unavailable.
 
     Args:
         period_days: Number of days to fetch (for indicator calculations)
@@ -19,141 +81,506 @@ def fetch_vnmidcap_from_investing(period_days: int = 365, max_retries: int = 3)
         DataFrame with OHLCV data or None if error
     """
     try:
-        from investiny import historical_data
-        from datetime import timedelta
-    except ImportError as e:
-        st.error(f"⚠️ investiny library not installed. Run: pip install investiny")
-        st.error(f"Import error details: {str(e)}")
+        return _fetch_vnmidcap_cached(period_days, max_retries)
+    except _FetchFailed:
         return None
 
-    # Calculate date range
+
+@st.cache_data(ttl=L1_CACHE_TTL)
+def _fetch_vnmidcap_cached(period_days: int, max_retries: int) -> pd.DataFrame:
+    """L1-cached body of `fetch_vnmidcap_from_investing`; raises _FetchFailed instead of returning None"""
+    df = _load_vnmidcap(period_days, max_retries)
+    _remember_summary(period_days, df)
+    return df
+
+
+def _load_vnmidcap(period_days: int, max_retries: int) -> pd.DataFrame:
+    """Disk cache / network lookup behind the L1; raises _FetchFailed if nothing is available"""
+    cached, servable = _serve_cached(
+        VNMIDCAP_INVESTING_ID, period_days,
+        refresh=lambda: _fetch_and_store(period_days, max_retries, quiet=True)
+    )
+    if servable:
+        return cached
+
+    df = _fetch_and_store(period_days, max_retries)
+    if df is not None and not df.empty:
+        return df
+    if cached is not None:
+        st.warning("⚠️ Investing.com unavailable - using last cached VNMIDCAP data")
+        return cached
+    raise _FetchFailed()
+
+
+@st.cache_resource
+def _disk_cache() -> FileCache:
+    """Process-wide disk cache handle; its in-memory LRU lets hot keys skip disk reads"""
+    return FileCache(root='.cache/investing', default_ttl=SWR_MAX_AGE, mem_lru=64)
+
+
+def _history_key(investing_id: str, period_days: int) -> str:
+    return FileCache.make_key(investing_id, period_days)
+
+
+def _store_history(investing_id: str, period_days: int, df: Optional[pd.DataFrame]) -> None:
+    """Store a successful fetch as the cached copy for the symbol/period"""
+    if df is not None and not df.empty:
+        _disk_cache().set(_history_key(investing_id, period_days), df)
+
+
+def _serve_cached(investing_id: str, period_days: int,
+                  refresh: Callable[[], None]) -> Tuple[Optional[pd.DataFrame], bool]:
+    """
+    Apply the stale-while-revalidate policy to the cached copy of a symbol
+
+    Args:
+        investing_id: Investing.com instrument id
+        period_days: Number of days fetched
+        refresh: Callable that re-fetches and stores the symbol (run on a daemon thread)
+
+    Returns:
+        (cached, servable) - cached is the disk copy of any age (or None, usable as
+        an error fallback); servable is True if it should be returned as-is
+    """
+    cached, age = _disk_cache().get_with_age(_history_key(investing_id, period_days))
+    if cached is None or age >= SWR_MAX_AGE:
+        return cached, False
+    if age > SWR_REFRESH_AFTER:
+        _refresh_in_background(investing_id, period_days, refresh)
+    return cached, True
+
+
+def _refresh_in_background(investing_id: str, period_days: int, refresh: Callable[[], None]) -> None:
+    """Run refresh on a daemon thread (at most one refresh per symbol/period at a time)"""
+    token = (investing_id, period_days)
+    with _refresh_lock:
+        if token in _refreshing:
+            return
+        _refreshing.add(token)
+
+    def _run():
+        try:
+            refresh()
+        except Exception as e:
+            log.warning("Background refresh of %s failed: %s", investing_id, e)
+        finally:
+            with _refresh_lock:
+                _refreshing.discard(token)
+
+    threading.Thread(target=_run, name=f'investing-refresh-{investing_id}', daemon=True).start()
+
+
+def _fetch_and_store(period_days: int, max_retries: int, quiet: bool = False) -> Optional[pd.DataFrame]:
+    """Fetch VNMIDCAP from the network and store it in the disk cache"""
+    from_date, to_date = _date_range(period_days)
+    df = _fetch_vnmidcap_remote(from_date, to_date, max_retries, quiet=quiet)
+    _store_history(VNMIDCAP_INVESTING_ID, period_days, df)
+    return df
+
+
+def _backoff_seconds(attempt: int) -> float:
+    """Jittered exponential backoff so concurrent sessions don't retry in lockstep"""
+    return random.uniform(0, min(20, 2 ** attempt * 1.5))
+
+
+def _circuit_is_open() -> bool:
+    with _circuit_lock:
+        return time.time() < _circuit['open_until']
+
+
+def _is_source_down(error: Exception) -> bool:
+    """True for errors meaning Investing.com is unreachable or throttling us (not a bad payload)"""
+    if isinstance(error, httpx.TransportError):
+        return True
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status >= 500 or status == 429
+    return False
+
+
+def _record_success() -> None:
+    with _circuit_lock:
+        _circuit['failures'] = 0
+        _circuit['open_until'] = 0.0
+
+
+def _record_failure() -> None:
+    """Count a fetch whose retries ended with the source down; open the circuit at the threshold"""
+    with _circuit_lock:
+        _circuit['failures'] += 1
+        if _circuit['failures'] >= CIRCUIT_FAILURE_THRESHOLD:
+            _circuit['open_until'] = time.time() + CIRCUIT_OPEN_SECONDS
+            _circuit['failures'] = 0
+
+
+def _date_range(period_days: int) -> Tuple[str, str]:
+    """Return (from_date, to_date) in MM/DD/YYYY format ending today"""
     end_date = datetime.now()
     start_date = end_date - timedelta(days=period_days)
+    return start_date.strftime('%m/%d/%Y'), end_date.strftime('%m/%d/%Y')
+
+
+def _build_ohlcv_frame(dates, data: dict) -> pd.DataFrame:
+    """
+    Build the OHLCV DataFrame from a column dict in a single pass
+
+    Columns get their final names and dtypes up front, so no rename or
+    per-column conversion pass is needed afterwards.
+
+    Args:
+        dates: Parsed datetime values, one per row
+        data: Dict with 'open', 'high', 'low', 'close' and optional 'volume' lists
+    """
+    # Investing.com omits volume for some symbols and can send null/NaN entries
+    if 'volume' in data:
+        volume = pd.to_numeric(pd.Series(data['volume']), errors='coerce').fillna(0).astype(np.int64).values
+    else:
+        volume = np.zeros(len(dates), dtype=np.int64)
+
+    return pd.DataFrame({
+        'Date': dates,
+        'Open': np.asarray(data['open'], dtype=np.float64),
+        'High': np.asarray(data['high'], dtype=np.float64),
+        'Low': np.asarray(data['low'], dtype=np.float64),
+        'Close': np.asarray(data['close'], dtype=np.float64),
+        'Volume': volume,
+    })
+
+
+def _clean_ohlcv_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Drop invalid dates, add compatibility columns and sort chronologically"""
+    # Remove invalid dates (no copy in the common case where every date is valid)
+    mask = df['Date'].notna().values
+    if not mask.all():
+        df = df.iloc[mask].reset_index(drop=True)
+
+    # Add compatibility columns (always zero for an index - int8 instead of int64)
+    df['Dividends'] = np.zeros(len(df), dtype=np.int8)
+    df['Stock Splits'] = np.zeros(len(df), dtype=np.int8)
+
+    # Investing.com returns bars in time order - only sort if that doesn't hold
+    dates_ns = _dates_ns(df)
+    if not _is_monotonic(dates_ns):
+        df = df.iloc[np.argsort(dates_ns, kind='stable')].reset_index(drop=True)
+    return df
+
+
+def _dates_ns(df: pd.DataFrame) -> np.ndarray:
+    """Date column as int64 nanoseconds (no copy when already datetime64[ns])"""
+    return df['Date'].values.astype('datetime64[ns]', copy=False).view('int64')
+
+
+def _today_ns() -> int:
+    """Today's date (midnight) as int64 nanoseconds since epoch"""
+    return int(np.datetime64('today', 'ns').astype(np.int64))
+
+
+def _is_monotonic(dates_ns: np.ndarray) -> bool:
+    """Single vectorized pass: True if int64 (ns) dates are non-decreasing"""
+    return bool((dates_ns[1:] >= dates_ns[:-1]).all())
+
+
+def _days_old(latest_ns: int, today_ns: Optional[int] = None) -> int:
+    """Whole days between the latest date (int64 ns) and today - O(1), no scan"""
+    if today_ns is None:
+        today_ns = _today_ns()
+    return int((today_ns - latest_ns) // _NS_PER_DAY)
+
 
-    # Format dates for investiny (MM/DD/YYYY)
-    from_date = start_date.strftime('%m/%d/%Y')
-    to_date = end_date.strftime('%m/%d/%Y')
+def _fetch_vnmidcap_remote(from_date: str, to_date: str, max_retries: int = 3,
+                           quiet: bool = False) -> Optional[pd.DataFrame]:
+    """
+    Fetch VNMIDCAP data from Investing.com (no caching)
+
+    Args:
+        from_date: Start date in MM/DD/YYYY format
+        to_date: End date in MM/DD/YYYY format
+        max_retries: Maximum number of retry attempts
+        quiet: Log instead of writing to the page (for background refreshes,
+            which run outside a Streamlit script context)
+
+    Returns:
+        DataFrame with OHLCV data or None if error
+    """
+    if _circuit_is_open():
+        log.info("Investing.com circuit open - skipping VNMIDCAP fetch")
+        return None
+
+    session = _investing_session()
+    params = _history_params(VNMIDCAP_INVESTING_ID, from_date, to_date)
 
-    # Retry logic with exponential backoff
+    # Retry logic with jittered exponential backoff
+    source_down = False
     for attempt in range(max_retries):
+        source_down = False
         try:
             if attempt > 0:
-                wait_time = 2 ** attempt  # Exponential backoff: 2s, 4s, 8s
-                st.info(f"🔄 Retry attempt {attempt + 1}/{max_retries} for VNMIDCAP (waiting {wait_time}s)...")
+                wait_time = _backoff_seconds(attempt)
+                log.debug("Retry attempt %d/%d for VNMIDCAP (waiting %.1fs)", attempt + 1, max_retries, wait_time)
                 time.sleep(wait_time)
 
             # Fetch data from Investing.com
             # investing_id='995069' corresponds to VN Mid Cap (VNIMC)
-            st.info(f"📡 Fetching VNMIDCAP from Investing.com (ID: 995069, {from_date} to {to_date})...")
+            log.debug("Fetching VNMIDCAP from Investing.com (ID: %s, %s to %s)", VNMIDCAP_INVESTING_ID, from_date, to_date)
 
-            data = historical_data(
-                investing_id='995069',
-                from_date=from_date,
-                to_date=to_date
-            )
+            response = session.get(_INVESTING_HISTORY_URL.format(uuid=uuid4().hex), params=params)
+            response.raise_for_status()
+            payload = response.json()
 
             # Validate response
-            if not data:
-                error_msg = f"❌ No data returned from Investing.com for VNMIDCAP (attempt {attempt + 1}/{max_retries})"
-                if attempt == max_retries - 1:
-                    st.error(error_msg)
-                    st.error("💡 Possible causes: Network issue, API rate limit, or IP blocked by Investing.com")
-                else:
-                    st.warning(error_msg)
+            if not payload:
+                log.warning("No data returned from Investing.com for VNMIDCAP (attempt %d/%d)", attempt + 1, max_retries)
                 continue
 
-            if not isinstance(data, dict):
-                error_msg = f"❌ Invalid data type from Investing.com: {type(data)} (attempt {attempt + 1}/{max_retries})"
-                if attempt == max_retries - 1:
-                    st.error(error_msg)
-                else:
-                    st.warning(error_msg)
+            if not isinstance(payload, dict) or payload.get('s') != 'ok':
+                log.warning("Invalid response from Investing.com: %s (attempt %d/%d)",
+                            payload.get('s') if isinstance(payload, dict) else type(payload), attempt + 1, max_retries)
                 continue
 
-            # Convert to DataFrame
-            df = pd.DataFrame(data)
-
-            if df.empty:
-                error_msg = f"❌ Empty DataFrame from Investing.com for VNMIDCAP (attempt {attempt + 1}/{max_retries})"
-                if attempt == max_retries - 1:
-                    st.error(error_msg)
-                    st.error(f"Raw data keys: {list(data.keys()) if data else 'None'}")
-                else:
-                    st.warning(error_msg)
+            # Check the raw row count before materializing a DataFrame
+            if len(payload.get('t', [])) == 0:
+                log.warning("Empty data from Investing.com for VNMIDCAP (attempt %d/%d), keys: %s",
+                            attempt + 1, max_retries, list(payload.keys()))
                 continue
 
-            # Convert date column to datetime
-            df['date'] = pd.to_datetime(df['date'], format='%m/%d/%Y', errors='coerce')
-
-            # Remove invalid dates
-            df = df.dropna(subset=['date'])
+            # Build DataFrame once with final column names and dtypes
+            df = _clean_ohlcv_frame(_frame_from_payload(payload))
 
             if df.empty:
-                error_msg = f"❌ No valid dates in VNMIDCAP data (attempt {attempt + 1}/{max_retries})"
-                if attempt == max_retries - 1:
-                    st.error(error_msg)
-                    st.error(f"Raw dates sample: {list(data.get('date', []))[:5] if isinstance(data, dict) else 'N/A'}")
-                else:
-                    st.warning(error_msg)
+                log.warning("No valid dates in VNMIDCAP data (attempt %d/%d), sample: %s",
+                            attempt + 1, max_retries, list(payload.get('t', []))[:5])
                 continue
 
-            # Rename columns to match expected format
-            df = df.rename(columns={
-                'date': 'Date',
-                'open': 'Open',
-                'high': 'High',
-                'low': 'Low',
-                'close': 'Close',
-                'volume': 'Volume'
-            })
-
-            # Add compatibility columns
-            df['Dividends'] = 0
-            df['Stock Splits'] = 0
-
-            # Sort by date
-            df = df.sort_values('Date').reset_index(drop=True)
-
-            # Check data freshness
-            latest_date = df['Date'].max()
-            days_old = (datetime.now() - latest_date.to_pydatetime()).days
-
-            if days_old > 7:
-                st.warning(f"⚠️ VNMIDCAP data may be outdated. Latest: {latest_date.strftime('%Y-%m-%d')} ({days_old} days old)")
+            # Check data freshness (sorted, so the last row is the latest)
+            days_old = _days_old(_dates_ns(df)[-1])
+            latest_str = np.datetime_as_string(df['Date'].values[-1], unit='D')
+
+            if days_old > 7 and quiet:
+                log.warning("VNMIDCAP data may be outdated. Latest: %s (%d days old)", latest_str, days_old)
+            elif days_old > 7:
+                st.warning(f"⚠️ VNMIDCAP data may be outdated. Latest: {latest_str} ({days_old} days old)")
             else:
-                st.success(f"✅ VNMIDCAP data loaded successfully: {len(df)} records, latest {latest_date.strftime('%Y-%m-%d')}")
+                log.info("VNMIDCAP data loaded: %d records, latest %s", len(df), latest_str)
 
+            _record_success()
             return df
 
         except Exception as e:
-            error_msg = f"❌ Error fetching VNMIDCAP (attempt {attempt + 1}/{max_retries}): {str(e)}"
-
-            if attempt == max_retries - 1:
-                # Last attempt - show full error details
-                st.error(error_msg)
-                st.error(f"Exception type: {type(e).__name__}")
-                st.error("Full traceback:")
+            log.warning("Error fetching VNMIDCAP (attempt %d/%d): %s: %s",
+                        attempt + 1, max_retries, type(e).__name__, e)
+            source_down = _is_source_down(e)
+            if _DEBUG and not quiet:
                 st.code(traceback.format_exc())
-                st.error("💡 Troubleshooting tips:")
-                st.error("1. Check if Streamlit Cloud IP is blocked by Investing.com")
-                st.error("2. Verify investiny library version (should be >=0.7.0)")
-                st.error("3. Check network connectivity from Streamlit Cloud")
-                st.error("4. Consider using alternative data source (Yahoo Finance, vnstock)")
-                return None
-            else:
-                st.warning(error_msg)
-                continue
+            continue
 
     # All retries exhausted
-    st.error(f"❌ Failed to fetch VNMIDCAP after {max_retries} attempts")
+    if quiet:
+        log.error("Failed to fetch VNMIDCAP after %d attempts", max_retries)
+    else:
+        st.error(f"❌ Failed to fetch VNMIDCAP after {max_retries} attempts")
+    if source_down:
+        _record_failure()
     return None
 
 
+def _history_params(investing_id: str, from_date: str, to_date: str) -> dict:
+    """Query parameters for the Investing.com daily history endpoint"""
+    return {
+        'symbol': investing_id,
+        'resolution': 'D',
+        'from': int(datetime.strptime(from_date, '%m/%d/%Y').timestamp()),
+        'to': int(datetime.strptime(to_date, '%m/%d/%Y').timestamp()),
+    }
+
+
+def _frame_from_payload(payload: dict) -> pd.DataFrame:
+    """Convert a raw history payload ({t, o, h, l, c, v}) to an OHLCV DataFrame"""
+    # Daily bars are stamped at 00:00 UTC; epoch seconds convert without string parsing
+    dates = pd.to_datetime(np.asarray(payload['t'], dtype=np.int64), unit='s').normalize()
+    data = {'open': payload['o'], 'high': payload['h'], 'low': payload['l'], 'close': payload['c']}
+    if 'v' in payload:
+        data['volume'] = payload['v']
+    return _build_ohlcv_frame(dates, data)
+
+
+@st.cache_resource
+def _investing_session() -> httpx.Client:
+    """Process-wide HTTP client so TCP/TLS connections are reused across reruns and sessions"""
+    return httpx.Client(
+        http2=True,
+        timeout=10.0,
+        headers=_INVESTING_HEADERS,
+        limits=httpx.Limits(max_keepalive_connections=4)
+    )
+
+
+def _investing_async_client() -> httpx.AsyncClient:
+    """AsyncClient for Investing.com: HTTP/2 and a multi-connection pool so symbols don't serialize"""
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=10.0,
+        headers=_INVESTING_HEADERS,
+        limits=httpx.Limits(max_connections=8)
+    )
+
+
+async def _fetch_history_async(client: httpx.AsyncClient, investing_id: str, period_days: int,
+                               max_retries: int = 3, use_cache: bool = True) -> Optional[pd.DataFrame]:
+    """
+    Fetch daily history for one Investing.com symbol without blocking the event loop
+
+    Uses the same stale-while-revalidate disk cache as the sync fetcher.
+
+    Args:
+        client: Shared AsyncClient
+        investing_id: Investing.com instrument id
+        period_days: Number of days to fetch, ending today
+        max_retries: Maximum number of attempts
+        use_cache: Serve from the disk cache when possible (False forces a network fetch)
+
+    Returns:
+        DataFrame with OHLCV data, the cached copy if all attempts failed, or None
+    """
+    cached = None
+    if use_cache:
+        cached, servable = _serve_cached(
+            investing_id, period_days,
+            refresh=lambda: asyncio.run(_refresh_history_async(investing_id, period_days, max_retries))
+        )
+        if servable:
+            return cached
+
+    if _circuit_is_open():
+        return cached
+
+    from_date, to_date = _date_range(period_days)
+    params = _history_params(investing_id, from_date, to_date)
+    source_down = False
+    for attempt in range(max_retries):
+        source_down = False
+        if attempt > 0:
+            await asyncio.sleep(_backoff_seconds(attempt))
+        try:
+            response = await client.get(_INVESTING_HISTORY_URL.format(uuid=uuid4().hex), params=params)
+            response.raise_for_status()
+            payload = response.json()
+            if not isinstance(payload, dict) or payload.get('s') != 'ok' or len(payload.get('t', [])) == 0:
+                continue
+
+            df = _clean_ohlcv_frame(_frame_from_payload(payload))
+            if not df.empty:
+                _record_success()
+                _store_history(investing_id, period_days, df)
+                return df
+        except Exception as e:
+            # Any failure stays local to this symbol so one bad id can't fail the whole gather
+            log.warning("Error fetching %s (attempt %d/%d): %s: %s",
+                        investing_id, attempt + 1, max_retries, type(e).__name__, e)
+            source_down = _is_source_down(e)
+            continue
+
+    if source_down:
+        _record_failure()
+    return cached
+
+
+async def _refresh_history_async(investing_id: str, period_days: int, max_retries: int) -> None:
+    """Force a network fetch of one symbol into the disk cache (background revalidation)"""
+    async with _investing_async_client() as client:
+        await _fetch_history_async(client, investing_id, period_days, max_retries, use_cache=False)
+
+
+async def fetch_many_investing_async(ids: List[str], period_days: int = 365,
+                                     max_retries: int = 3) -> Dict[str, Optional[pd.DataFrame]]:
+    """
+    Fetch several Investing.com symbols concurrently over one client
+
+    All requests are submitted at once and multiplexed as HTTP/2 streams on a
+    shared connection, then collected together.
+
+    Args:
+        ids: Investing.com instrument ids
+        period_days: Number of days to fetch (for indicator calculations)
+        max_retries: Maximum number of attempts per symbol
+
+    Returns:
+        Dict mapping investing_id -> DataFrame (or None if that symbol failed)
+    """
+    unique_ids = list(dict.fromkeys(ids))
+    async with _investing_async_client() as client:
+        results = await asyncio.gather(*(
+            _fetch_history_async(client, investing_id, period_days, max_retries)
+            for investing_id in unique_ids
+        ))
+    return dict(zip(unique_ids, results))
+
+
+def fetch_many_investing(ids: List[str], period_days: int = 365,
+                         max_retries: int = 3) -> Dict[str, Optional[pd.DataFrame]]:
+    """Sync entry point for `fetch_many_investing_async` (for use from Streamlit scripts)"""
+    return asyncio.run(fetch_many_investing_async(ids, period_days, max_retries))
+
+
+async def fetch_vnmidcap_async(period_days: int = 365, max_retries: int = 3) -> Optional[pd.DataFrame]:
+    """
+    Async variant of `fetch_vnmidcap_from_investing`
+
+    Talks to the Investing.com endpoint directly with httpx; to load several
+    symbols at once use `fetch_many_investing` instead.
+    Shares the on-disk cache with the sync fetcher.
+    """
+    results = await fetch_many_investing_async([VNMIDCAP_INVESTING_ID], period_days, max_retries)
+    return results[VNMIDCAP_INVESTING_ID]
+
+
+def _summarize(df: pd.DataFrame) -> dict:
+    """Lightweight metadata for a VNMIDCAP frame (sorted, so first/last rows are the range bounds)"""
+    return {
+        'n': len(df),
+        'first_date': df['Date'].iat[0],
+        'latest_date': df['Date'].iat[-1],
+        'latest_close': float(df['Close'].iat[-1]),
+        'columns': tuple(df.columns),  # immutable - the summary is shared across sessions
+    }
+
+
+def _remember_summary(period_days: int, df: pd.DataFrame) -> None:
+    """Record the summary of a freshly built L1 entry; it expires together with that entry"""
+    with _summaries_lock:
+        _summaries[period_days] = (time.time() + L1_CACHE_TTL, _summarize(df))
+
+
+def _vnmidcap_summary() -> Optional[dict]:
+    """
+    Lightweight metadata for the 365-day VNMIDCAP L1 entry
+
+    The summary is built from the same frame the L1 entry holds, at the same
+    time, and expires on the same timer, so it describes exactly what
+    `fetch_vnmidcap_from_investing` currently serves (which may itself be a
+    disk copy up to SWR_MAX_AGE old - check 'latest_date'). Probes read the
+    shared dict instead of paying for a pickle copy of the full DataFrame.
+    """
+    with _summaries_lock:
+        entry = _summaries.get(365)
+    if entry is not None and time.time() < entry[0]:
+        return entry[1]
+
+    # Expired or never built: (re)build the L1 entry, which records a new summary
+    df = fetch_vnmidcap_from_investing(365)
+    if df is None or df.empty:
+        return None
+    with _summaries_lock:
+        entry = _summaries.get(365)
+    if entry is not None and time.time() < entry[0]:
+        return entry[1]
+    # L1 hit whose summary isn't recorded in this process - describe the served frame directly
+    return _summarize(df)
+
+
 def test_investing_connection() -> bool:
-    """Test Investing.com connection"""
+    """Test Investing.com connection (reuses the cached 365-day fetch)"""
     try:
-        df = fetch_vnmidcap_from_investing(period_days=30)
-        return df is not None and not df.empty
+        return _vnmidcap_summary() is not None
     except:
         return False
 
@@ -161,14 +588,14 @@ def test_investing_connection() -> bool:
 def get_vnmidcap_data_info() -> dict:
     """Get VNMIDCAP data information from Investing.com"""
     try:
-        df = fetch_vnmidcap_from_investing(period_days=365)
-        if df is not None and not df.empty:
+        summary = _vnmidcap_summary()
+        if summary is not None:
             return {
-                'total_records': len(df),
-                'date_range': f"{df['Date'].min().strftime('%Y-%m-%d')} to {df['Date'].max().strftime('%Y-%m-%d')}",
-                'latest_close': df['Close'].iloc[-1] if 'Close' in df.columns else None,
-                'columns': list(df.columns),
-                'source': 'Investing.com (investiny)'
+                'total_records': summary['n'],
+                'date_range': f"{summary['first_date'].strftime('%Y-%m-%d')} to {summary['latest_date'].strftime('%Y-%m-%d')}",
+                'latest_close': summary['latest_close'],
+                'columns': list(summary['columns']),
+                'source': 'Investing.com'
             }
         return {'error': 'No data available'}
     except Exception as e:
@@ -0,0 +1,153 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+import pandas as pd
+
+
+class FileCache:
+    """
+    Persistent on-disk DataFrame cache
+
+    Each entry is stored as `<root>/<md5(key)>.parquet` with a sidecar
+    `<md5(key)>.json` holding `{created_at, ttl_seconds}`. Survives Streamlit
+    container restarts, unlike `st.cache_data`, so it is used as an L2 below it.
+
+    The most recently used `mem_lru` entries are also kept in memory, so hot
+    keys skip the stat/JSON/parquet reads. The memory layer stores and hands
+    out copies, so callers may freely modify the DataFrames they get back.
+    """
+
+    def __init__(self, root: str = ".cache", default_ttl: int = 86400, mem_lru: int = 0):
+        self.root = root
+        self.default_ttl = default_ttl
+        self.mem_lru = mem_lru
+        self._mem = OrderedDict()  # key -> (DataFrame, meta)
+        self._lock = threading.Lock()
+        self._root_ready = False
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """Build a stable cache key from arbitrary parts"""
+        return hashlib.md5("|".join(str(p) for p in parts).encode("utf-8")).hexdigest()
+
+    def _paths(self, key: str):
+        base = os.path.join(self.root, key)
+        return f"{base}.parquet", f"{base}.json"
+
+    def _mem_get(self, key: str):
+        with self._lock:
+            entry = self._mem.get(key)
+            if entry is None:
+                return None
+            self._mem.move_to_end(key)
+            df, meta = entry
+        return df.copy(), meta
+
+    def _mem_put(self, key: str, df: pd.DataFrame, meta: dict) -> None:
+        if self.mem_lru <= 0:
+            return
+        df = df.copy()
+        with self._lock:
+            self._mem[key] = (df, meta)
+            self._mem.move_to_end(key)
+            while len(self._mem) > self.mem_lru:
+                self._mem.popitem(last=False)
+
+    @staticmethod
+    def _valid_meta(meta) -> bool:
+        """Sidecar must be a dict with numeric created_at/ttl_seconds (anything else is a miss)"""
+        if not isinstance(meta, dict):
+            return False
+        return all(
+            isinstance(meta.get(field), (int, float)) and not isinstance(meta.get(field), bool)
+            for field in ("created_at", "ttl_seconds")
+        )
+
+    def _read(self, key: str) -> Tuple[Optional[pd.DataFrame], Optional[dict]]:
+        """Return (DataFrame, meta) from memory or disk, or (None, None)"""
+        entry = self._mem_get(key)
+        if entry is not None:
+            return entry
+
+        data_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if not self._valid_meta(meta):
+                return None, None
+            df = pd.read_parquet(data_path)
+        except (OSError, ValueError, ImportError):
+            return None, None
+
+        self._mem_put(key, df, meta)
+        return df, meta
+
+    def get(self, key: str, allow_expired: bool = False) -> Optional[pd.DataFrame]:
+        """
+        Return the cached DataFrame for key, or None if missing/expired/unreadable
+
+        Args:
+            key: Cache key (see `make_key`)
+            allow_expired: Return the entry even if its TTL has passed (stale fallback)
+        """
+        df, meta = self._read(key)
+        if df is None:
+            return None
+        if not allow_expired and time.time() - meta["created_at"] > meta["ttl_seconds"]:
+            return None
+        return df
+
+    def get_with_age(self, key: str) -> Tuple[Optional[pd.DataFrame], Optional[float]]:
+        """
+        Return (DataFrame, age in seconds) for key regardless of TTL
+
+        Lets callers apply their own freshness policy (e.g. stale-while-revalidate).
+        Returns (None, None) if the entry is missing or unreadable.
+        """
+        df, meta = self._read(key)
+        if df is None:
+            return None, None
+        return df, time.time() - meta["created_at"]
+
+    def set(self, key: str, df: pd.DataFrame, ttl: Optional[int] = None) -> None:
+        """Store df under key (best effort - disk write errors are ignored)"""
+        meta = {
+            "created_at": time.time(),
+            "ttl_seconds": ttl if ttl is not None else self.default_ttl
+        }
+        self._mem_put(key, df, meta)
+
+        data_path, meta_path = self._paths(key)
+        try:
+            if not self._root_ready:
+                os.makedirs(self.root, exist_ok=True)
+                self._root_ready = True
+            self._atomic_write(data_path, lambda tmp: df.to_parquet(tmp, compression="zstd", index=False))
+            self._atomic_write(meta_path, lambda tmp: self._write_json(tmp, meta))
+        except (OSError, ValueError, ImportError):
+            pass
+
+    def _atomic_write(self, path: str, write: Callable[[str], None]) -> None:
+        """Write via a unique temp file + os.replace so concurrent writers never share a temp path"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        os.close(fd)
+        try:
+            write(tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    @staticmethod
+    def _write_json(path: str, data: dict) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
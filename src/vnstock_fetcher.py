@@ -74,7 +74,7 @@ def fetch_vnstock_data(ticker: str, days: int = 365) -> Optional[pd.DataFrame]:
                 'volume': 'Volume'
             }
             
-            df = df.rename(columns=column_mapping)
+            df.rename(columns=column_mapping, inplace=True)
             
             # Ensure Date column is datetime
             if 'Date' in df.columns: